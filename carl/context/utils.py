@@ -1,7 +1,9 @@
-from typing import Any, Dict, List, Tuple, Type
+from typing import Any, Dict, Hashable, List, Tuple, Type
 
 import numpy as np
 
+from carl.utils.types import Context
+
 
 def get_context_bounds(
     context_keys: List[str], context_bounds: Dict[str, Tuple[float, float, Type[Any]]]
@@ -35,6 +37,44 @@ def get_context_bounds(
     return lower_bounds, upper_bounds
 
 
+def _to_hashable(value: Any) -> Hashable:
+    if isinstance(value, np.ndarray):
+        return value.shape, tuple(value.ravel().tolist())
+    if isinstance(value, (list, tuple)):
+        return tuple(_to_hashable(v) for v in value)
+    if isinstance(value, dict):
+        return get_context_key(value)
+    try:
+        hash(value)
+    except TypeError:
+        # Cannot be compared by value, never treat it as equal to another value
+        return object()
+    return value
+
+
+def get_context_key(context: Context) -> Hashable:
+    """
+    Get a hashable representation of a context.
+
+    Array, list and dict valued context features are converted to tuples so
+    that contexts can be compared cheaply and used as dictionary keys, e.g.
+    for caching. Contexts with other unhashable values get a key which is not
+    equal to any other key.
+
+    Parameters
+    ----------
+    context: Context
+        The context.
+
+    Returns
+    -------
+    Hashable
+        Tuple of sorted (name, value) pairs.
+
+    """
+    return tuple(sorted((k, _to_hashable(v)) for k, v in context.items()))
+
+
 if __name__ == "__main__":
     DEFAULT_CONTEXT = {
         "min_position": -1.2,  # unit?
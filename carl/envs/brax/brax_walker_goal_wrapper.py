@@ -1,7 +1,5 @@
 import gym
 import numpy as np
-from brax.io import mjcf
-from etils import epath
 
 STATE_INDICES = {
     "ant": [13, 14],
@@ -63,6 +61,8 @@ class BraxWalkerGoalWrapper(gym.Wrapper):
             or self.env_name == "walker2d"
         ):
             self.env._forward_reward_weight = 0
+        # Resolved once, `step` only needs the array of state indices
+        self.state_indices = np.array(STATE_INDICES[self.env_name])
         self.context = None
         self.position = None
         self.goal_position = None
@@ -106,13 +106,13 @@ class BraxWalkerGoalWrapper(gym.Wrapper):
             ],
             212: [np.sin(22.5 * np.pi / 180), np.cos(22.5 * np.pi / 180)],
         }
-        path = epath.resource_path("brax") / asset_path
-        sys = mjcf.load(path)
-        self.dt = sys.dt
+        # Time between two steps of the brax env, as host float instead of the
+        # device array brax stores
+        self.dt = float(env.unwrapped._env.dt)
 
     def reset(self, seed=None, options={}):
         state, info = self.env.reset(seed=seed, options=options)
-        self.position = (0, 0)
+        self.position = np.zeros(2)
         self.goal_position = (
             np.array(self.direction_values[self.context["target_direction"]])
             * self.context["target_distance"]
@@ -123,11 +123,9 @@ class BraxWalkerGoalWrapper(gym.Wrapper):
 
     def step(self, action):
         state, _, te, tr, info = self.env.step(action)
-        indices = STATE_INDICES[self.env_name]
-        new_position = (
-            np.array(list(self.position))
-            + np.array([state[indices[0]], state[indices[1]]]) * self.dt
-        )
+        # One transfer of the (device) state instead of indexing it per element
+        velocity = np.asarray(state)[self.state_indices]
+        new_position = self.position + velocity * self.dt
         current_distance_to_goal = np.linalg.norm(self.goal_position - new_position)
         previous_distance_to_goal = np.linalg.norm(self.goal_position - self.position)
         direction_reward = max(0, previous_distance_to_goal - current_distance_to_goal)
@@ -1,18 +1,17 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Collection, Hashable
 
-from dataclasses import asdict
+from collections import OrderedDict
 
 import brax
 import gymnasium
 import numpy as np
-from brax.base import Geometry, Inertia, Link, System
-from brax.io import mjcf
-from etils import epath
+from brax.base import Geometry, Inertia, System
 from jax import numpy as jp
 
 from carl.context.selection import AbstractSelector
+from carl.context.utils import get_context_key
 from carl.envs.brax.brax_walker_goal_wrapper import (
     BraxLanguageWrapper,
     BraxWalkerGoalWrapper,
@@ -21,10 +20,23 @@ from carl.envs.brax.wrappers import GymWrapper, VectorGymWrapper
 from carl.envs.carl_env import CARLEnv
 from carl.utils.types import Context, Contexts
 
+# Context features which can be updated in the brax system, in addition to every
+# feature starting with `mass_`
+REGISTERED_CONTEXT_FEATURES = frozenset(
+    [
+        "friction",
+        "ang_damping",
+        "gravity",
+        "viscosity",
+        "elasticity",
+        "target_distance",
+        "target_direction",
+        "target_radius",
+    ]
+)
+
 
-def set_geom_attr(
-    geom: Geometry, data: dict[str, Any], context: dict[str, Any], key: str
-) -> dict:
+def set_geom_attr(geom: Geometry, context: dict[str, Any], key: str) -> Geometry:
     """Set Geometry attribute
 
     Check whether the desired attribute is present both in the geometry and in the context.
@@ -33,8 +45,6 @@ def set_geom_attr(
     ----------
     geom : Geometry
         Brax geometry (a surface or spatial volume with a shape and material properties)
-    data : dict[str, Any]
-        Data from the Geometry dataclass, potentially already modified.
     context : dict[str, Any]
         The context to set.
     key : str
@@ -42,15 +52,15 @@ def set_geom_attr(
 
     Returns
     -------
-    dict
-        Modified data from the geometry dataclas.
+    Geometry
+        The geometry with the updated attribute.
     """
-    if key in context and key in data:
+    if key in context and hasattr(geom, key):
         value = getattr(geom, key)
         n_items = len(value)
         vec = jp.array([context[key]] * n_items)
-        data[key] = vec
-    return data
+        geom = geom.replace(**{key: vec})
+    return geom
 
 
 def set_masses2(sys: System, context: dict[str, Any]) -> System:
@@ -63,8 +73,30 @@ def set_masses2(sys: System, context: dict[str, Any]) -> System:
     return sys
 
 
+def get_link_indices(sys: System) -> dict[str, int]:
+    """Get the index of each link in the brax system
+
+    The links of a system do not change with the context, so this only needs to be
+    computed once per (base) system.
+
+    Parameters
+    ----------
+    sys : System
+        The brax system definition.
+
+    Returns
+    -------
+    dict[str, int]
+        Link name to link index.
+    """
+    return {link_name: idx for idx, link_name in enumerate(sys.link_names)}
+
+
 def _set_masses(
-    context: dict[str, Any], inertia: Inertia, link_names: list[str]
+    context: dict[str, Any],
+    inertia: Inertia,
+    link_names: list[str],
+    link_indices: dict[str, int] | None = None,
 ) -> Inertia:
     """Actual/helper method to set masses
 
@@ -79,6 +111,9 @@ def _set_masses(
         The inertia dataclass.
     link_names : list[str]
         Available link names.
+    link_indices : dict[str, int] | None, optional
+        Precomputed link indices, see `get_link_indices`. If None, they are
+        computed from `link_names`.
 
     Raises
     ------
@@ -90,23 +125,31 @@ def _set_masses(
     Inertia
         Update inertia dataclass.
     """
-    inertia_data = asdict(inertia)
+    if link_indices is None:
+        link_indices = {link_name: idx for idx, link_name in enumerate(link_names)}
+    indices = []
+    masses = []
     for cfname, cfvalue in context.items():
         if cfname.startswith("mass"):
             link_name = cfname.split("_", 1)[-1]
-            if link_name in link_names:
-                idx = link_names.index(link_name)
-                inertia_data["mass"] = inertia_data["mass"].at[idx].set(cfvalue)
+            if link_name in link_indices:
+                indices.append(link_indices[link_name])
+                masses.append(cfvalue)
             else:
                 raise RuntimeError(
                     f"Link {link_name} not in available link names {link_names}. Probably "
                     "something went wrong during context creation."
                 )
-    inertia_new = Inertia(**inertia_data)
-    return inertia_new
+    if not indices:
+        return inertia
+    # Set all masses at once instead of one update per link
+    mass = inertia.mass.at[jp.array(indices)].set(jp.array(masses))
+    return inertia.replace(mass=mass)
 
 
-def set_masses(sys: System, context: dict[str, Any]) -> System:
+def set_masses(
+    sys: System, context: dict[str, Any], link_indices: dict[str, int] | None = None
+) -> System:
     """Set masses
 
     The required syntax for masses is as follows:
@@ -118,34 +161,36 @@ def set_masses(sys: System, context: dict[str, Any]) -> System:
         The brax system definition.
     context : dict[str, Any]
         Context to set.
+    link_indices : dict[str, int] | None, optional
+        Precomputed link indices of `sys`, see `get_link_indices`.
 
     Returns
     -------
     System
         The updated system.
     """
-    link_data = asdict(sys.link)
-    inertia_new = _set_masses(context, sys.link.inertia, sys.link_names)
-    link_data["inertia"] = inertia_new
-    link_new = Link(**link_data)
-    sys = sys.replace(link=link_new)
+    inertia_new = _set_masses(
+        context, sys.link.inertia, sys.link_names, link_indices=link_indices
+    )
+    sys = sys.replace(link=sys.link.replace(inertia=inertia_new))
     return sys
 
 
 def check_context(
-    context: dict[str, Any], registered_context_features: list[str]
+    context: dict[str, Any], registered_context_features: Collection[str]
 ) -> None:
     for cfname in context.keys():
         if cfname not in registered_context_features and not cfname.startswith("mass_"):
             raise RuntimeError(
                 f"Context feature {cfname} can not be updated in the brax system. Only "
-                f"{registered_context_features} are possible."
+                f"{sorted(registered_context_features)} are possible."
             )
 
 
 class CARLBraxEnv(CARLEnv):
     env_name: str
     backend: str = "spring"
+    max_cached_systems: int = 16
 
     def __init__(
         self,
@@ -189,6 +234,13 @@ class CARLBraxEnv(CARLEnv):
         env_name: str
             The registered gymnasium environment name.
         backend: str
+        base_sys: System
+            The system of the created brax env, including the overrides brax
+            applies for the backend (e.g. dt and gears). Context updates are
+            applied to a copy of it.
+        max_cached_systems: int
+            Maximum number of updated systems cached by context, so switching
+            back and forth between contexts reuses the systems.
 
         """
         if env is None:
@@ -240,6 +292,12 @@ class CARLBraxEnv(CARLEnv):
                         env = BraxLanguageWrapper(env)
         self.use_language_goals = use_language_goals
 
+        # Every context update starts from this (immutable) system instead of
+        # reloading the asset from disk.
+        self.base_sys: System = env.unwrapped.sys
+        self._link_indices = get_link_indices(self.base_sys)
+        self._sys_cache: OrderedDict[Hashable, System] = OrderedDict()
+
         super().__init__(
             env=env,
             contexts=contexts,
@@ -253,45 +311,51 @@ class CARLBraxEnv(CARLEnv):
 
     def _update_context(self) -> None:
         context = self.context
+        check_context(context, REGISTERED_CONTEXT_FEATURES)
+
+        key = get_context_key(context)
+        if key in self._sys_cache:
+            self._sys_cache.move_to_end(key)
+        else:
+            self._sys_cache[key] = self._build_system(context)
+            if len(self._sys_cache) > self.max_cached_systems:
+                self._sys_cache.popitem(last=False)
+        self.env.unwrapped.sys = self._sys_cache[key]
+
+    def _build_system(self, context: Context) -> System:
+        """Build the brax system for a context from the base system
+
+        Parameters
+        ----------
+        context : Context
+            The context to set.
 
-        # Those context features can be updated + every feature starting with `mass_`
-        registered_cfs = [
-            "friction",
-            "ang_damping",
-            "gravity",
-            "viscosity",
-            "elasticity",
-            "target_distance",
-            "target_direction",
-            "target_radius",
-        ]
-        check_context(context, registered_cfs)
-
-        path = epath.resource_path("brax") / self.asset_path
-        sys = mjcf.load(path)
+        Returns
+        -------
+        System
+            The updated system.
+        """
+        sys = self.base_sys
 
+        # Values are set as arrays like the fields of the loaded system, so that all
+        # systems share one signature of the jitted step and reset functions
         if "gravity" in context:
-            sys = sys.replace(gravity=jp.array([0, 0, self.context["gravity"]]))
+            sys = sys.replace(gravity=jp.array([0, 0, context["gravity"]]))
         if "ang_damping" in context:
-            sys = sys.replace(ang_damping=self.context["ang_damping"])
+            sys = sys.replace(ang_damping=jp.array(context["ang_damping"]))
         if "viscosity" in context:
-            sys = sys.replace(ang_damping=self.context["viscosity"])
+            sys = sys.replace(viscosity=jp.array(context["viscosity"]))
 
-        sys = set_masses(sys, context)
+        sys = set_masses(sys, context, link_indices=self._link_indices)
 
         if "friction" in context or "elasticity" in context:
             updated_geoms = []
-            for i, geom in enumerate(sys.geoms):
-                cls = type(geom)
-                data = asdict(geom)
-                data = set_geom_attr(geom, data, context, "friction")
-                data = set_geom_attr(geom, data, context, "elasticity")
-
-                geom_new = cls(**data)
-                updated_geoms.append(geom_new)
+            for geom in sys.geoms:
+                geom = set_geom_attr(geom, context, "friction")
+                geom = set_geom_attr(geom, context, "elasticity")
+                updated_geoms.append(geom)
             sys = sys.replace(geoms=updated_geoms)
-
-        self.env.unwrapped.sys = sys
+        return sys
 
     def reset(
         self, *, seed: int | None = None, options: dict[str, Any] | None = None
@@ -300,7 +364,7 @@ class CARLBraxEnv(CARLEnv):
         last_context_id = self.context_id
         self._progress_instance()
         if self.context_id != last_context_id:
-            self._update_context()
+            self._maybe_update_context()
         self.env.context = self.context
         state, info = self.env.reset(seed=seed, options=options)
         state = self._add_context_to_state(state)
@@ -17,17 +17,35 @@
 # limitations under the License.
 
 """Wrappers to convert brax envs to gym envs."""
-from typing import ClassVar, Optional
+from typing import Any, Callable, ClassVar, Optional
 
 import gym
 import jax
 import numpy as np
+from brax.base import System
 from brax.envs.base import PipelineEnv
 from brax.io import image
 from gym import spaces
 from gym.vector import utils
 
 
+def call_with_sys(env: PipelineEnv, sys: System, fn: Callable, *args: Any) -> Any:
+    """Call `fn` while the unwrapped brax env uses `sys` as its system.
+
+    Used inside the jitted reset and step functions so that the system is an
+    argument of the compiled function instead of a constant captured at trace
+    time. That way one compiled function serves all contexts and updating the
+    system does not trigger a recompilation.
+    """
+    unwrapped = env.unwrapped
+    original_sys = unwrapped.sys
+    unwrapped.sys = sys
+    try:
+        return fn(*args)
+    finally:
+        unwrapped.sys = original_sys
+
+
 class GymWrapper(gym.Env):
     """A wrapper that converts Brax Env to one that follows Gym API."""
 
@@ -51,6 +69,8 @@ class GymWrapper(gym.Env):
         self.backend = backend
         self._state = None
         self.render_mode = render_mode
+        # The system is passed to the jitted functions, set it to change the context
+        self.sys: System = self._env.unwrapped.sys
 
         obs = np.inf * np.ones(self._env.observation_size, dtype="float32")
         self.observation_space = spaces.Box(-obs, obs, dtype="float32")
@@ -58,27 +78,27 @@ class GymWrapper(gym.Env):
         action = np.ones(self._env.action_size, dtype="float32")
         self.action_space = spaces.Box(-action, action, dtype="float32")
 
-        def reset(key):
+        def reset(sys, key):
             key1, key2 = jax.random.split(key)
-            state = self._env.reset(key2)
+            state = call_with_sys(self._env, sys, self._env.reset, key2)
             return state, state.obs, key1
 
         self._reset = jax.jit(reset, backend=self.backend)
 
-        def step(state, action):
-            state = self._env.step(state, action)
+        def step(sys, state, action):
+            state = call_with_sys(self._env, sys, self._env.step, state, action)
             info = {**state.metrics, **state.info}
             return state, state.obs, state.reward, state.done, info
 
         self._step = jax.jit(step, backend=self.backend)
 
     def reset(self, seed: Optional[int] = None, options: dict = {}):
-        self._state, obs, self._key = self._reset(self._key)
+        self._state, obs, self._key = self._reset(self.sys, self._key)
         # We return device arrays for pytorch users.
         return obs, {}
 
     def step(self, action):
-        self._state, obs, reward, done, info = self._step(self._state, action)
+        self._state, obs, reward, done, info = self._step(self.sys, self._state, action)
         # We return device arrays for pytorch users.
         return obs, reward, done, False, info
 
@@ -87,7 +107,7 @@ class GymWrapper(gym.Env):
 
     def render(self):
         if self.render_mode == "rgb_array":
-            sys, state = self._env.sys, self._state
+            sys, state = self.sys, self._state
             if state is None:
                 raise RuntimeError("must call reset or step before rendering")
             return image.render_array(sys, state.pipeline_state, 256, 256)
@@ -122,6 +142,8 @@ class VectorGymWrapper(gym.vector.VectorEnv):
         self.seed(seed)
         self.backend = backend
         self._state = None
+        # The system is passed to the jitted functions, set it to change the context
+        self.sys: System = self._env.unwrapped.sys
 
         obs = np.inf * np.ones(self._env.observation_size, dtype="float32")
         obs_space = spaces.Box(-obs, obs, dtype="float32")
@@ -131,26 +153,26 @@ class VectorGymWrapper(gym.vector.VectorEnv):
         action_space = spaces.Box(-action, action, dtype="float32")
         self.action_space = utils.batch_space(action_space, self.num_envs)
 
-        def reset(key):
+        def reset(sys, key):
             key1, key2 = jax.random.split(key)
-            state = self._env.reset(key2)
+            state = call_with_sys(self._env, sys, self._env.reset, key2)
             return state, state.obs, key1
 
         self._reset = jax.jit(reset, backend=self.backend)
 
-        def step(state, action):
-            state = self._env.step(state, action)
+        def step(sys, state, action):
+            state = call_with_sys(self._env, sys, self._env.step, state, action)
             info = {**state.metrics, **state.info}
             return state, state.obs, state.reward, state.done, info
 
         self._step = jax.jit(step, backend=self.backend)
 
     def reset(self):
-        self._state, obs, self._key = self._reset(self._key)
+        self._state, obs, self._key = self._reset(self.sys, self._key)
         return obs, {}
 
     def step(self, action):
-        self._state, obs, reward, done, info = self._step(self._state, action)
+        self._state, obs, reward, done, info = self._step(self.sys, self._state, action)
         return obs, reward, done, False, info
 
     def seed(self, seed: int = 0):
@@ -158,7 +180,7 @@ class VectorGymWrapper(gym.vector.VectorEnv):
 
     def render(self):
         if self.render_mode == "rgb_array":
-            sys, state = self._env.sys, self._state
+            sys, state = self.sys, self._state
             if state is None:
                 raise RuntimeError("must call reset or step before rendering")
             return image.render_array(sys, state.pipeline_state, 256, 256)
@@ -1,16 +1,18 @@
 from __future__ import annotations
 
 import abc
-from typing import Any, SupportsFloat, TypeVar
+from typing import Any, Hashable, SupportsFloat, TypeVar
 
 import inspect
 
 import gymnasium
+import numpy as np
 from gymnasium import Wrapper, spaces
 from gymnasium.core import Env
 
 from carl.context.context_space import ContextFeature, ContextSpace
 from carl.context.selection import AbstractSelector, RoundRobinSelector
+from carl.context.utils import get_context_key
 from carl.utils.types import Context, Contexts
 
 ObsType = TypeVar("ObsType")
@@ -83,6 +85,10 @@ class CARLEnv(Wrapper, abc.ABC):
             }  # was self.get_default_context(self) before
         self.contexts = contexts
         self.context: Context | None = None  # Set by `_progress_instance`
+        # Key of the context last set via `_maybe_update_context` and the context
+        # as left by `_update_context`
+        self._last_context_key: Hashable | None = None
+        self._last_context: Context | None = None
         if obs_context_features is None:
             obs_context_features = list(list(self.contexts.values())[0].keys())
         self.obs_context_features = obs_context_features
@@ -111,6 +117,11 @@ class CARLEnv(Wrapper, abc.ABC):
             obs_context_feature_names=self.obs_context_features
         )
 
+        # Observed context as a vector and the context it was built from, see
+        # `_get_context_vector`
+        self._context_vector: np.ndarray | None = None
+        self._context_vector_source: Context | None = None
+
     @property
     def contexts(self) -> Contexts:
         return self._contexts
@@ -154,7 +165,7 @@ class CARLEnv(Wrapper, abc.ABC):
         self.context_selector.context_id = new_id
         self.context_selector.context = self.context_selector.contexts[new_id]
         self.context = self.context_selector.context
-        self._update_context()
+        self._maybe_update_context()
 
     def get_observation_space(
         self, obs_context_feature_names: list[str] | None = None
@@ -267,7 +278,7 @@ class CARLEnv(Wrapper, abc.ABC):
         last_context_id = self.context_id
         self._progress_instance()
         if self.context_id != last_context_id:
-            self._update_context()
+            self._maybe_update_context()
         state, info = super().reset(seed=seed, options=options)
         state = self._add_context_to_state(state)
         info["context_id"] = self.context_id
@@ -293,7 +304,7 @@ class CARLEnv(Wrapper, abc.ABC):
         """
 
         if not self.obs_context_as_dict:
-            context = [self.context[k] for k in self.obs_context_features]
+            context = self._get_context_vector()
         else:
             context = {
                 k: v for k, v in self.context.items() if k in self.obs_context_features
@@ -304,6 +315,51 @@ class CARLEnv(Wrapper, abc.ABC):
         }
         return state_context_dict
 
+    def _get_context_vector(self) -> np.ndarray:
+        """Get the observed context features of the current context as a vector
+
+        The vector is built once per context update and reused for every
+        observation until the next one or until `self.context` is replaced.
+
+        Returns
+        -------
+        np.ndarray
+            Values of `self.obs_context_features`, same dtype as the
+            observation space.
+        """
+        stale = self._context_vector_source is not self.context
+        if self._context_vector is None or stale:
+            context = self.get_context_space().insert_defaults(self.context)
+            self._context_vector = np.array(
+                [context[k] for k in self.obs_context_features], dtype=np.float32
+            )
+            self._context_vector_source = self.context
+        return self._context_vector.copy()
+
+    def _maybe_update_context(self) -> None:
+        """Update the context unless it equals the context set before.
+
+        Different context ids can hold equal contexts, e.g. in sampled context
+        sets. Updating the environment with the context it already has is
+        skipped. `self.context` is then set to the context as left by the last
+        update, so changes `_update_context` makes to it (e.g. inserting
+        defaults) also apply to the equal context.
+
+        Returns
+        -------
+        None
+
+        """
+        # `_update_context` may change `self.context`, rebuild the vector from it
+        self._context_vector = None
+        context_key = get_context_key(self.context)
+        if context_key != self._last_context_key:
+            self._update_context()
+            self._last_context_key = context_key
+            self._last_context = self.context
+        else:
+            self.context = self._last_context
+
     @abc.abstractmethod
     def _update_context(self) -> None:
         """
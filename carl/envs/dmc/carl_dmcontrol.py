@@ -1,12 +1,23 @@
 from __future__ import annotations
 
+from typing import Hashable
+
+from collections import OrderedDict
+
+import dm_env  # type: ignore
 from gymnasium import spaces
 
 from carl.context.selection import AbstractSelector
+from carl.context.utils import get_context_key
 from carl.envs.carl_env import CARLEnv
+from carl.envs.dmc.dmc_tasks.utils import (
+    OPTION_CONTEXT_FEATURES,
+    adapt_options,
+    get_options,
+)
 from carl.envs.dmc.loader import load_dmc_env
 from carl.envs.dmc.wrappers import MujocoToGymWrapper
-from carl.utils.types import Contexts
+from carl.utils.types import Context, Contexts
 
 
 class CARLDmcEnv(CARLEnv):
@@ -24,12 +35,24 @@ class CARLDmcEnv(CARLEnv):
 
     For descriptions of the other parameters see the parent class CARLEnv.
 
+    Attributes
+    ----------
+    max_cached_envs : int
+        Maximum number of loaded dm-control environments cached by context.
+        Switching back to a cached context reuses the compiled model instead
+        of loading it again. Context features which only change the simulator
+        options (`OPTION_CONTEXT_FEATURES`) do not need their own environment,
+        they are written into the model of the cached one after restoring the
+        options the model was compiled with.
+
     Raises
     ------
     NotImplementedError
         Dict observation spaces are not implemented for dm-control yet.
     """
 
+    max_cached_envs: int = 64
+
     def __init__(
         self,
         contexts: Contexts | None = None,
@@ -66,15 +89,38 @@ class CARLDmcEnv(CARLEnv):
         self.whitelist_gaussian_noise = list(
             self.get_context_features().keys()  # type: ignore
         )  # allow to augment all values
+        # Cached environments together with the options they were compiled with
+        self._env_cache: OrderedDict[
+            Hashable, tuple[dm_env.Environment, Context]
+        ] = OrderedDict()
 
     def _update_context(self) -> None:
-        env = load_dmc_env(
-            domain_name=self.domain,
-            task_name=self.task,
-            context=self.context,
-            environment_kwargs={"flat_observation": True},
-        )
-        self.env = MujocoToGymWrapper(env)
+        structural_context = {
+            k: v for k, v in self.context.items() if k not in OPTION_CONTEXT_FEATURES
+        }
+        key = get_context_key(structural_context)
+        if key in self._env_cache:
+            self._env_cache.move_to_end(key)
+        else:
+            env = load_dmc_env(
+                domain_name=self.domain,
+                task_name=self.task,
+                context=structural_context,
+                environment_kwargs={"flat_observation": True},
+            )
+            self._env_cache[key] = (env, get_options(env.physics.model))
+            if len(self._env_cache) > self.max_cached_envs:
+                self._env_cache.popitem(last=False)
+        env, default_options = self._env_cache[key]
+        # Options missing in the context must not keep the values of the last one
+        adapt_options(env.physics.model, default_options)
+        adapt_options(env.physics.model, self.context)
+        # The spaces do not depend on the context, keep the gym wrapper
+        self.env.swap_underlying(env)
+
+    def close(self) -> None:
+        super().close()
+        self._env_cache.clear()
 
     def render(self):
         return self.env.render(mode="rgb_array")
@@ -33,7 +33,10 @@ from dm_control.suite.finger import (  # type: ignore
     get_model_and_assets,
 )
 
-from carl.envs.dmc.dmc_tasks.utils import adapt_context  # type: ignore
+from carl.envs.dmc.dmc_tasks.utils import (  # type: ignore
+    adapt_context,
+    physics_from_xml_string,
+)
 from carl.utils.types import Context
 
 
@@ -212,7 +215,7 @@ def spin_context(
     xml_string = get_finger_xml_string(**context)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = Spin(random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -236,7 +239,7 @@ def turn_easy_context(
     xml_string = get_finger_xml_string(**context)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = Turn(target_radius=_EASY_TARGET_SIZE, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -260,7 +263,7 @@ def turn_hard_context(
     xml_string = get_finger_xml_string(**context)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = Turn(target_radius=_HARD_TARGET_SIZE, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
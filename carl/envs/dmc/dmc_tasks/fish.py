@@ -26,7 +26,10 @@ from dm_control.rl import control  # type: ignore
 from dm_control.suite import base, common  # type: ignore
 from dm_control.utils import containers, rewards  # type: ignore
 
-from carl.envs.dmc.dmc_tasks.utils import adapt_context  # type: ignore
+from carl.envs.dmc.dmc_tasks.utils import (  # type: ignore
+    adapt_context,
+    physics_from_xml_string,
+)
 from carl.utils.types import Context
 
 _DEFAULT_TIME_LIMIT = 40
@@ -60,7 +63,7 @@ def upright_context(
     xml_string, assets = get_model_and_assets()
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = Upright(random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -83,7 +86,7 @@ def swim_context(
     xml_string, assets = get_model_and_assets()
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = Swim(random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -32,7 +32,10 @@ from dm_control.suite.point_mass import (  # type: ignore
     get_model_and_assets,
 )
 
-from carl.envs.dmc.dmc_tasks.utils import adapt_context  # type: ignore
+from carl.envs.dmc.dmc_tasks.utils import (  # type: ignore
+    adapt_context,
+    physics_from_xml_string,
+)
 from carl.utils.types import Context
 
 
@@ -236,7 +239,7 @@ def easy_pointmass(
     xml_string = make_model(**context)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = ContextualPointMass(randomize_gains=False, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -260,7 +263,7 @@ def hard_pointmass(
     xml_string = make_model(**context)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = ContextualPointMass(randomize_gains=True, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
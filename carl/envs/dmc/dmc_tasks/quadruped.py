@@ -31,7 +31,10 @@ from dm_control.utils import containers, rewards, xml_tools  # type: ignore
 from lxml import etree  # type: ignore
 from scipy import ndimage
 
-from carl.envs.dmc.dmc_tasks.utils import adapt_context  # type: ignore
+from carl.envs.dmc.dmc_tasks.utils import (  # type: ignore
+    adapt_context,
+    physics_from_xml_string,
+)
 from carl.utils.types import Context
 
 enums = mjbindings.enums
@@ -114,7 +117,7 @@ def walk_context(
     xml_string = make_model(floor_size=_DEFAULT_TIME_LIMIT * _WALK_SPEED)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, common.ASSETS)
+    physics = physics_from_xml_string(Physics, xml_string, common.ASSETS)
     task = Move(desired_speed=_WALK_SPEED, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -137,7 +140,7 @@ def run_context(
     xml_string = make_model(floor_size=_DEFAULT_TIME_LIMIT * _RUN_SPEED)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, common.ASSETS)
+    physics = physics_from_xml_string(Physics, xml_string, common.ASSETS)
     task = Move(desired_speed=_RUN_SPEED, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -160,7 +163,7 @@ def escape_context(
     xml_string = make_model(floor_size=40, terrain=True, rangefinders=True)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, common.ASSETS)
+    physics = physics_from_xml_string(Physics, xml_string, common.ASSETS)
     task = Escape(random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -183,7 +186,7 @@ def fetch_context(
     xml_string = make_model(walls_and_ball=True)
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, common.ASSETS)
+    physics = physics_from_xml_string(Physics, xml_string, common.ASSETS)
     task = Fetch(random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -1,9 +1,35 @@
 from __future__ import annotations
 
+from typing import Dict, Optional, Type, TypeVar, Union
+
+from collections import OrderedDict
+
+from dm_control import mujoco  # type: ignore
 from lxml import etree  # type: ignore
 
 from carl.utils.types import Context
 
+PhysicsT = TypeVar("PhysicsT", bound=mujoco.Physics)
+
+# Context features which only change the simulator options (`mjModel.opt`). They
+# can be written into an already compiled model, see `adapt_options`. The timestep
+# is not part of it because dm-control derives the number of physics substeps per
+# control step from it when the environment is created.
+OPTION_CONTEXT_FEATURES = [
+    "gravity",
+    "wind_x",
+    "wind_y",
+    "wind_z",
+    "density",
+    "viscosity",
+]
+
+# Compiled model binaries keyed by the (adapted) xml string and the asset names.
+# Loading a binary skips parsing and compiling the MJCF, which dominates the cost
+# of building a task for a new context.
+MAX_CACHED_MODELS = 64
+_MODEL_BINARY_CACHE: OrderedDict[tuple, bytes] = OrderedDict()
+
 
 def adapt_context(xml_string: bytes, context: Context) -> bytes:
     """Adapts and returns the xml_string of the model with the given context."""
@@ -167,3 +193,61 @@ def adapt_context(xml_string: bytes, context: Context) -> bytes:
 
     xml_string = etree.tostring(mjcf, pretty_print=True)
     return xml_string
+
+
+def get_options(model: mujoco.wrapper.MjModel) -> Context:
+    """Reads the option context features from the compiled model.
+
+    Counterpart of `adapt_options`, used to restore the options of the xml after
+    the model was adapted to another context.
+    """
+    opt = model.opt
+    return {
+        "gravity": -float(opt.gravity[2]),
+        "wind_x": float(opt.wind[0]),
+        "wind_y": float(opt.wind[1]),
+        "wind_z": float(opt.wind[2]),
+        "density": float(opt.density),
+        "viscosity": float(opt.viscosity),
+    }
+
+
+def adapt_options(model: mujoco.wrapper.MjModel, context: Context) -> None:
+    """Writes the option context features into the compiled model in place.
+
+    Mirrors the option handling of `adapt_context` on a `mjModel` instead of the
+    xml string.
+    """
+    opt = model.opt
+    if "gravity" in context:
+        opt.gravity[2] = -context["gravity"]
+    if "wind_x" in context and "wind_y" in context and "wind_z" in context:
+        opt.wind[:] = [context["wind_x"], context["wind_y"], context["wind_z"]]
+    if "density" in context:
+        opt.density = context["density"]
+    if "viscosity" in context:
+        opt.viscosity = context["viscosity"]
+
+
+def physics_from_xml_string(
+    physics_cls: Type[PhysicsT],
+    xml_string: Union[str, bytes],
+    assets: Optional[Dict] = None,
+) -> PhysicsT:
+    """Builds `physics_cls` from the xml string, compiling each model only once.
+
+    The first call for an xml string compiles it as usual and stores the model
+    binary. Later calls load the physics from that binary. The assets of the
+    tasks are static files, so their names are sufficient as part of the key.
+    """
+    key = (xml_string, tuple(sorted(assets or {})))
+    model_binary = _MODEL_BINARY_CACHE.get(key)
+    if model_binary is not None:
+        _MODEL_BINARY_CACHE.move_to_end(key)
+        return physics_cls.from_byte_string(model_binary)
+
+    physics = physics_cls.from_xml_string(xml_string, assets)
+    _MODEL_BINARY_CACHE[key] = physics.model.to_bytes()
+    if len(_MODEL_BINARY_CACHE) > MAX_CACHED_MODELS:
+        _MODEL_BINARY_CACHE.popitem(last=False)
+    return physics
@@ -27,7 +27,10 @@ from dm_control.suite import base, common  # type: ignore
 from dm_control.suite.utils import randomizers  # type: ignore
 from dm_control.utils import containers, rewards  # type: ignore
 
-from carl.envs.dmc.dmc_tasks.utils import adapt_context  # type: ignore
+from carl.envs.dmc.dmc_tasks.utils import (  # type: ignore
+    adapt_context,
+    physics_from_xml_string,
+)
 from carl.utils.types import Context
 
 _DEFAULT_TIME_LIMIT = 25
@@ -62,7 +65,7 @@ def stand_context(
     xml_string, assets = get_model_and_assets()
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = PlanarWalker(move_speed=0, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -85,7 +88,7 @@ def walk_context(
     xml_string, assets = get_model_and_assets()
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = PlanarWalker(move_speed=_WALK_SPEED, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -108,7 +111,7 @@ def run_context(
     xml_string, assets = get_model_and_assets()
     if context != {}:
         xml_string = adapt_context(xml_string=xml_string, context=context)
-    physics = Physics.from_xml_string(xml_string, assets)
+    physics = physics_from_xml_string(Physics, xml_string, assets)
     task = PlanarWalker(move_speed=_RUN_SPEED, random=random)
     environment_kwargs = environment_kwargs or {}
     return control.Environment(
@@ -53,6 +53,19 @@ class MujocoToGymWrapper(gym.Env):
             low=lows, high=highs, shape=shapes, dtype=dtype
         )
 
+    def swap_underlying(self, env: dm_env) -> None:
+        """Replace the wrapped dm-control environment.
+
+        The action and observation spaces are kept. They are the same for all
+        contexts of a domain and task, so they are not rebuilt.
+
+        Parameters
+        ----------
+        env: dm_env
+            The dm-control environment to wrap instead.
+        """
+        self.env = env
+
     def step(self, action: ActType) -> Tuple[ObsType, float, bool, dict]:
         """Run one timestep of the environment's dynamics. When end of
         episode is reached, you are responsible for calling `reset()`
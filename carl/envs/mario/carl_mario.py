@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from typing import List
-
 import sys
 
 import numpy as np
@@ -15,8 +13,7 @@ from carl.context.context_space import (
 from carl.context.selection import AbstractSelector
 from carl.envs.carl_env import CARLEnv
 from carl.envs.mario.pcg_smb_env import MarioEnv
-from carl.envs.mario.pcg_smb_env.toadgan.toad_gan import generate_level
-from carl.utils.types import Contexts
+from carl.utils.types import Context, Contexts
 
 LEVEL_HEIGHT = 16
 
@@ -49,24 +46,31 @@ class CARLMarioEnv(CARLEnv):
             context_selector_kwargs=context_selector_kwargs,
             **kwargs,
         )
-        self.levels: List[str] = []
+        # Generate the levels for all contexts upfront, they are cached by their
+        # generation parameters
+        for context in self.contexts.values():
+            self._generate_level(context)
+
+    @staticmethod
+    def _generate_level(context: Context) -> str:
+        # Imported here so that importing the env does not import torch and the
+        # generators, which are only needed once levels are generated.
+        from carl.envs.mario.pcg_smb_env.toadgan.toad_gan import generate_level_string
+
+        return generate_level_string(
+            width=context["level_width"],
+            height=LEVEL_HEIGHT,
+            level_index=context["level_index"],
+            seed=context["noise_seed"],
+            filter_unplayable=True,
+        )
 
     def _update_context(self) -> None:
         self.env: MarioEnv
         self.context = CARLMarioEnv.get_context_space().insert_defaults(self.context)
-        if not self.levels:
-            for context in self.contexts.values():
-                level, _ = generate_level(
-                    width=context["level_width"],
-                    height=LEVEL_HEIGHT,
-                    level_index=context["level_index"],
-                    seed=context["noise_seed"],
-                    filter_unplayable=True,
-                )
-                self.levels.append(level)
         self.env.mario_state = self.context["mario_state"]
         self.env.mario_inertia = self.context["mario_inertia"]
-        self.env.levels = [self.levels[self.context_id]]
+        self.env.levels = [self._generate_level(self.context)]
 
     @staticmethod
     def get_context_features() -> dict[str, ContextFeature]:
@@ -200,10 +200,12 @@ class MarioEnv(gymnasium.Env):
         )
         if self.hide_points_banner:
             frame[: self.points_banner_height, :] = 0
+        # Write into the preallocated observation instead of allocating a new one
         if self.grayscale:
-            self._obs = np.concatenate([self._obs[1:], frame[np.newaxis]])
+            self._obs[:-1] = self._obs[1:]
+            self._obs[-1] = frame
         else:
-            self._obs = np.transpose(frame, axes=(2, 0, 1))
+            self._obs[:] = np.transpose(frame, axes=(2, 0, 1))
 
     def _maybe_launch_gateway(self):
         if MarioEnv.port is not None:
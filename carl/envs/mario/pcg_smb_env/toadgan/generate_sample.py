@@ -116,12 +116,8 @@ def generate_sample(
 
 def one_hot_to_ascii_level(level: Any, tokens: Any) -> List[str]:
     """Converts a full token level tensor to an ascii level."""
-    ascii_level = []
-    for i in range(level.shape[2]):
-        line = ""
-        for j in range(level.shape[3]):
-            line += tokens[level[:, :, i, j].argmax()]
-        if i < level.shape[2] - 1:
-            line += "\n"
-        ascii_level.append(line)
+    # One argmax over the token dimension for all tiles instead of one per tile
+    token_indices = level.reshape(-1, *level.shape[2:]).argmax(dim=0).tolist()
+    ascii_level = ["".join(tokens[t] for t in row) + "\n" for row in token_indices]
+    ascii_level[-1] = ascii_level[-1][:-1]
     return ascii_level
@@ -1,6 +1,7 @@
 import functools
 import os
 import sys
+import warnings
 from dataclasses import dataclass
 
 import torch
@@ -87,30 +88,55 @@ def generate_level(
     seed: int,
     filter_unplayable: bool = True,
 ):
+    """Generate a level with the TOAD-GAN of the given level index.
+
+    Generation is deterministic given the arguments (all noise is seeded). A
+    level is therefore only generated once, generating it again cannot turn an
+    unplayable level into a playable one. With `filter_unplayable`, a warning
+    is raised if the generated level is not playable.
+    """
     toad_gan = load_generator(level_index)
-    playable = False
-    level = None
-    initial_noise = None
-    tries = 0
-    while not playable:
-        tries += 1
-        initial_noise = generate_initial_noise(width, height, level_index, seed)
-        level = generate_sample(
-            **vars(toad_gan),
-            scale_h=width / toad_gan.original_width,
-            scale_v=height / toad_gan.original_height,
-            initial_noise=initial_noise,
-        )
-        if filter_unplayable and tries < 100:
-            _, playable = reachability_map(
-                level, shape=(height, width), check_outside=True
+    initial_noise = generate_initial_noise(width, height, level_index, seed)
+    level = generate_sample(
+        **vars(toad_gan),
+        scale_h=width / toad_gan.original_width,
+        scale_v=height / toad_gan.original_height,
+        initial_noise=initial_noise,
+    )
+    if filter_unplayable:
+        _, playable = reachability_map(level, shape=(height, width), check_outside=True)
+        if not playable:
+            warnings.warn(
+                f"Generated level (width={width}, level_index={level_index}, "
+                f"seed={seed}) is not playable."
             )
-        else:
-            playable = True
     assert level and isinstance(initial_noise, Tensor)
     return "".join(level), initial_noise.numpy()
 
 
+@functools.lru_cache(maxsize=1024)
+def generate_level_string(
+    width: int,
+    height: int,
+    level_index: int,
+    seed: int,
+    filter_unplayable: bool = True,
+) -> str:
+    """Cached version of `generate_level` which only returns the level.
+
+    Generation is deterministic given the arguments, so levels for repeated
+    contexts are only generated once per process.
+    """
+    level, _ = generate_level(
+        width=width,
+        height=height,
+        level_index=level_index,
+        seed=seed,
+        filter_unplayable=filter_unplayable,
+    )
+    return level
+
+
 def generate_initial_noise(
     width: int, height: int, level_index: int, seed: int
 ) -> Tensor:
@@ -88,7 +88,6 @@ setuptools.setup(
         "pandas>=1.3.0",
         "matplotlib>=3.4.2",
         "dataclasses>=0.6",
-        "numpyencoder>=0.3.0",
         "pyglet>=1.5.15",
         "pytablewriter>=0.62.0",
         "PyYAML>=5.4.1",
@@ -1,5 +1,7 @@
 import unittest
 
+import numpy as np
+
 from carl.envs.gymnasium.classic_control.carl_pendulum import CARLPendulum
 
 CARLPendulum.render_mode = "rgb_array"
@@ -27,6 +29,62 @@ class TestStateConstruction(unittest.TestCase):
         state, info = env.reset()
         self.assertEqual(len(state["context"]), n)
 
+    def test_observation_context_vector(self):
+        contexts = {
+            0: CARLPendulum.get_default_context(),
+            1: {"g": 5.0},
+        }
+        env = CARLPendulum(contexts=contexts, obs_context_as_dict=False)
+        state, info = env.reset()
+        context = state["context"]
+        self.assertEqual(context.dtype, np.float32)
+        self.assertEqual(context.shape, env.observation_space["context"].shape)
+        state, info = env.reset()
+        self.assertAlmostEqual(
+            state["context"][env.obs_context_features.index("g")], 5.0
+        )
+
+    def test_observation_context_vector_follows_update(self):
+        env = CARLPendulum(
+            contexts={0: CARLPendulum.get_default_context()},
+            obs_context_as_dict=False,
+        )
+        update_context = env._update_context
+
+        def _update_context():
+            update_context()
+            env.context = {**env.context, "g": 7.0}
+
+        env._update_context = _update_context
+        state, info = env.reset()
+        self.assertAlmostEqual(
+            state["context"][env.obs_context_features.index("g")], 7.0
+        )
+
+    def test_skip_update_for_equal_context(self):
+        context = CARLPendulum.get_default_context()
+        env = CARLPendulum(contexts={0: context, 1: dict(context)})
+        updated_ids = []
+        env._update_context = lambda: updated_ids.append(env.context_id)
+        env.reset()
+        env.reset()
+        self.assertEqual(updated_ids, [0])
+
+    def test_skipped_update_keeps_normalized_context(self):
+        env = CARLPendulum(contexts={0: {"g": 5.0}, 1: {"g": 5.0}})
+        update_context = env._update_context
+
+        def _update_context():
+            update_context()
+            env.context = env.get_context_space().insert_defaults(env.context)
+
+        env._update_context = _update_context
+        for _ in range(2):
+            state, info = env.reset()
+            self.assertEqual(
+                set(state["context"].keys()), set(env.obs_context_features)
+            )
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,7 +1,11 @@
 import inspect
 import unittest
 
+import brax
+import numpy as np
+
 import carl.envs.gymnasium
+from carl.envs.brax import CARLBraxAnt
 
 
 class TestBraxEnvs(unittest.TestCase):
@@ -23,5 +27,64 @@ class TestBraxEnvs(unittest.TestCase):
                     raise e
 
 
+class TestBraxContexts(unittest.TestCase):
+    def rollout(self, env, n_steps=10):
+        # Same key for every rollout, the brax wrapper ignores the reset seed
+        env.env.seed(0)
+        state, info = env.reset()
+        action = np.zeros(env.action_space.shape, dtype=np.float32)
+        for _ in range(n_steps):
+            state, reward, terminated, truncated, info = env.step(action)
+        return np.asarray(state["obs"])
+
+    def test_default_context_keeps_brax_system(self):
+        env = CARLBraxAnt()
+        env.reset()
+        sys = env.env.unwrapped.sys
+        brax_sys = brax.envs.get_environment(env.env_name, backend=env.backend).sys
+        np.testing.assert_allclose(sys.dt, brax_sys.dt)
+        np.testing.assert_allclose(sys.actuator.gear, brax_sys.actuator.gear)
+
+    def test_system_matches_context(self):
+        context = {
+            **CARLBraxAnt.get_default_context(),
+            "gravity": -5.0,
+            "friction": 0.7,
+            "elasticity": 0.1,
+            "ang_damping": -0.1,
+            "mass_torso": 12.0,
+            "viscosity": 0.2,
+        }
+        env = CARLBraxAnt(contexts={0: context})
+        env.reset()
+        sys = env.env.unwrapped.sys
+        np.testing.assert_allclose(sys.gravity, [0, 0, -5.0])
+        np.testing.assert_allclose(sys.ang_damping, -0.1)
+        np.testing.assert_allclose(sys.viscosity, 0.2)
+        torso = sys.link_names.index("torso")
+        np.testing.assert_allclose(sys.link.inertia.mass[torso], 12.0)
+        for geom in sys.geoms:
+            np.testing.assert_allclose(geom.friction, 0.7)
+            np.testing.assert_allclose(geom.elasticity, 0.1)
+
+    def test_context_changes_simulation(self):
+        context = CARLBraxAnt.get_default_context()
+        contexts = {0: context, 1: {**context, "gravity": -1.0}}
+        env = CARLBraxAnt(contexts=contexts)
+        obs_0 = self.rollout(env)
+        obs_1 = self.rollout(env)
+        self.assertFalse(np.allclose(obs_0, obs_1))
+        np.testing.assert_allclose(self.rollout(env), obs_0)
+
+    def test_context_switch_does_not_recompile(self):
+        context = CARLBraxAnt.get_default_context()
+        contexts = {0: context, 1: {**context, "gravity": -1.0, "friction": 0.5}}
+        env = CARLBraxAnt(contexts=contexts)
+        for _ in range(3):
+            self.rollout(env, n_steps=2)
+        self.assertEqual(env.env._reset._cache_size(), 1)
+        self.assertEqual(env.env._step._cache_size(), 1)
+
+
 if __name__ == "__main__":
     TestBraxEnvs().test_envs()
@@ -2,7 +2,7 @@ import unittest
 
 import numpy as np
 
-from carl.context.utils import get_context_bounds
+from carl.context.utils import get_context_bounds, get_context_key
 
 
 class TestContextBounds(unittest.TestCase):
@@ -59,5 +59,19 @@ class TestContextBounds(unittest.TestCase):
         self.assertEqual(upper.all(), np.array([np.inf] * upper.shape[0]).all())
 
 
+class TestContextKey(unittest.TestCase):
+    def test_equal_contexts(self):
+        context = {"g": 9.81, "wind": np.array([0.0, 1.0]), "size": [1, 2]}
+        other = {"size": [1, 2], "wind": np.array([0.0, 1.0]), "g": 9.81}
+        self.assertEqual(get_context_key(context), get_context_key(other))
+        self.assertNotEqual(
+            get_context_key(context), get_context_key({**context, "g": 5.0})
+        )
+
+    def test_unhashable_values_never_equal(self):
+        context = {"g": 9.81, "ids": {1, 2}}
+        self.assertNotEqual(get_context_key(context), get_context_key(context))
+
+
 if __name__ == "__main__":
     TestContextBounds.test_context_bounds()
@@ -1,3 +1,4 @@
+import numpy as np
 import pytest
 
 from carl.envs.dmc import (
@@ -21,7 +22,12 @@ from carl.envs.dmc.dmc_tasks.pointmass import (
 )
 from carl.envs.dmc.dmc_tasks.pointmass import make_model as make_pointmass_model
 from carl.envs.dmc.dmc_tasks.quadruped import make_model as make_quadruped_model
-from carl.envs.dmc.dmc_tasks.utils import adapt_context
+from carl.envs.dmc.dmc_tasks.utils import (
+    _MODEL_BINARY_CACHE,
+    adapt_context,
+    physics_from_xml_string,
+)
+from carl.envs.dmc.dmc_tasks.walker import Physics as WalkerPhysics
 from carl.envs.dmc.dmc_tasks.walker import (
     get_model_and_assets as get_walker_model_and_assets,
 )
@@ -56,6 +62,98 @@ class TestDMCLoader:
             )
 
 
+class TestDmcEnvCache:
+    def test_reuse_env_for_known_context(self):
+        env = CARLDmcWalkerEnv(
+            contexts={
+                0: {"joint_damping": 1.0},
+                1: {"joint_damping": 2.0},
+            }
+        )
+        wrapper = env.env
+        env.reset()
+        env_0 = env.env.env
+        env.reset()
+        assert env.env.env is not env_0
+        env.reset()
+        assert env.env.env is env_0
+        assert env.env is wrapper
+        assert len(env._env_cache) == 2
+
+    def test_options_set_in_place(self):
+        env = CARLDmcWalkerEnv(
+            contexts={
+                0: {"gravity": 9.81, "viscosity": 0.0},
+                1: {"gravity": 5.0, "viscosity": 0.1},
+            }
+        )
+        env.reset()
+        env_0 = env.env.env
+        env.reset()
+        assert env.env.env is env_0
+        opt = env.env.env.physics.model.opt
+        assert opt.gravity[2] == pytest.approx(-5.0)
+        assert opt.viscosity == pytest.approx(0.1)
+        assert len(env._env_cache) == 1
+
+    def test_missing_options_are_restored(self):
+        env = CARLDmcWalkerEnv(
+            contexts={
+                0: {"gravity": 5.0, "viscosity": 0.1},
+                1: {},
+            }
+        )
+        default_opt = load_dmc_env(
+            domain_name="walker",
+            task_name="walk_context",
+            context={},
+            environment_kwargs={"flat_observation": True},
+        ).physics.model.opt
+        env.reset()
+        env_0 = env.env.env
+        env.reset()
+        assert env.env.env is env_0
+        opt = env.env.env.physics.model.opt
+        assert opt.gravity[2] == pytest.approx(default_opt.gravity[2])
+        assert opt.viscosity == pytest.approx(default_opt.viscosity)
+
+    def test_close_clears_cache(self):
+        env = CARLDmcWalkerEnv()
+        env.reset()
+        env.close()
+        assert len(env._env_cache) == 0
+
+
+class TestModelBinaryCache:
+    def test_build_from_cached_binary(self, monkeypatch):
+        _MODEL_BINARY_CACHE.clear()
+        xml_string, assets = get_walker_model_and_assets()
+        xml_string = adapt_context(xml_string=xml_string, context={"gravity": 5.0})
+        physics_0 = physics_from_xml_string(WalkerPhysics, xml_string, assets)
+        assert len(_MODEL_BINARY_CACHE) == 1
+
+        def from_xml_string(*args, **kwargs):
+            raise AssertionError("model was compiled again")
+
+        monkeypatch.setattr(WalkerPhysics, "from_xml_string", from_xml_string)
+        physics_1 = physics_from_xml_string(WalkerPhysics, xml_string, assets)
+        assert isinstance(physics_1, WalkerPhysics)
+        assert physics_1.model.to_bytes() == physics_0.model.to_bytes()
+        np.testing.assert_array_equal(
+            physics_1.model.opt.gravity, physics_0.model.opt.gravity
+        )
+        assert physics_1.model.opt.timestep == physics_0.model.opt.timestep
+
+    def test_cache_hits_do_not_share_models(self):
+        xml_string, assets = get_walker_model_and_assets()
+        physics_0 = physics_from_xml_string(WalkerPhysics, xml_string, assets)
+        physics_1 = physics_from_xml_string(WalkerPhysics, xml_string, assets)
+        physics_2 = physics_from_xml_string(WalkerPhysics, xml_string, assets)
+        assert physics_1.model is not physics_2.model
+        physics_1.model.opt.gravity[2] = -1.0
+        assert physics_2.model.opt.gravity[2] == physics_0.model.opt.gravity[2]
+
+
 class TestFinger:
     def test_finger_constraints(self):
         # Finger can reach spinner?